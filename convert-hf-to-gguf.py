@@ -316,13 +316,14 @@ class Model:
                         data = data.astype(np.float32)
                     data_qtype = gguf.GGMLQuantizationType.F32
 
-                shape = gguf.quant_shape_from_byte_shape(data.shape, data_qtype) if data.dtype == np.uint8 else data.shape
+                if logger.isEnabledFor(logging.INFO):
+                    shape = gguf.quant_shape_from_byte_shape(data.shape, data_qtype) if data.dtype == np.uint8 else data.shape
 
-                # reverse shape to make it similar to the internal ggml dimension order
-                shape_str = f"{{{', '.join(str(n) for n in reversed(shape))}}}"
+                    # reverse shape to make it similar to the internal ggml dimension order
+                    shape_str = "{" + ", ".join(map(str, reversed(shape))) + "}"
 
-                # n_dims is implicit in the shape
-                logger.info(f"{f'%-{max_name_len}s' % f'{new_name},'} {old_dtype} --> {data_qtype.name}, shape = {shape_str}")
+                    # n_dims is implicit in the shape
+                    logger.info("%-*s %s --> %s, shape = %s", max_name_len, new_name + ",", old_dtype, data_qtype.name, shape_str)
 
                 self.gguf_writer.add_tensor(new_name, data, raw_dtype=data_qtype)
 